@@ -3,11 +3,21 @@ Vedic Kundali API Server
 Uses PyJHora for comprehensive astrological calculations
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-import traceback
+import orjson
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from importlib import metadata
+import asyncio
+import functools
+import hashlib
+import logging
 import re
+import threading
 
 # PyJHora imports
 from jhora.horoscope.main import Horoscope
@@ -16,10 +26,43 @@ from jhora.horoscope.chart import charts, strength, ashtakavarga
 from jhora.panchanga import drik
 from jhora import utils
 
+log = logging.getLogger(__name__)
+
+
+def _dumps(content):
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (C extension, emits bytes directly).
+    
+    Defined here rather than imported from fastapi.responses, where it is
+    deprecated in favour of response models, which these endpoints don't use.
+    """
+    
+    def render(self, content):
+        return _dumps(content)
+
+
+# Bump whenever response contents change; it is part of every ETag
+API_VERSION = "1.0.0"
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Prewarm in the background so startup isn't held up; keeping the task
+    # referenced stops it being garbage collected while it runs
+    prewarm = asyncio.create_task(_prewarm())
+    yield
+    prewarm.cancel()
+
+
 app = FastAPI(
     title="Vedic Kundali API",
     description="Open-source Kundali generation API using PyJHora",
-    version="1.0.0"
+    version=API_VERSION,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -28,6 +71,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 
@@ -89,524 +133,847 @@ SPECIAL_LAGNA_NAMES = {
     'IL': 'Indu Lagna', 'KL': 'Karakamsha Lagna', 'BB': 'Bhrigu Bindu'
 }
 
+# Planet names by id (Sun..Saturn, plus Ascendant or the nodes) and sign names by index
+_PLANET_NAMES_7 = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn')
+_PLANET_NAMES_8 = _PLANET_NAMES_7 + ('Ascendant',)
+_PLANET_NAMES_9 = _PLANET_NAMES_7 + ('Rahu', 'Ketu')
+_SIGN_NAMES = ('Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+               'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces')
+
+# Sign pattern, compiled once at import
+_SIGN_RE = re.compile('|'.join(
+    [re.escape(sym) for sym in SIGN_SYMBOLS] + list(SIGN_SYMBOLS.values())
+))
+_SIGN_LOOKUP = {**SIGN_SYMBOLS, **{name: name for name in SIGN_SYMBOLS.values()}}
+# PyJHora strings start with the sign glyph; each glyph is a distinct codepoint
+_SIGN_BY_FIRST_CHAR = {sym[0]: name for sym, name in SIGN_SYMBOLS.items()}
+
+# Minute/second marks in D° M’ S" strings. PyJHora's const._minute_symbol is
+# U+2019 (’); ASCII and prime glyphs are accepted as well.
+_MINUTE_MARKS = "'\u2019\u2032"
+_SECOND_MARKS = '"\u2033'
+
+
+def _scan_int(s, i):
+    """Skip whitespace from s[i], then read a run of digits; returns (value, end)"""
+    n = len(s)
+    while i < n and s[i].isspace():
+        i += 1
+    j = i
+    while j < n and s[j].isdecimal():
+        j += 1
+    return (int(s[i:j]) if j > i else None), j
+
+
+def _scan_dms(pos_str):
+    """Find the first X° Y’ Z" group; returns (d, m, s) or None"""
+    n = len(pos_str)
+    deg = pos_str.find('\u00b0')
+    while deg != -1:
+        start = deg
+        while start > 0 and pos_str[start - 1].isdecimal():
+            start -= 1
+        if start < deg:
+            minute, i = _scan_int(pos_str, deg + 1)
+            if minute is not None and i < n and pos_str[i] in _MINUTE_MARKS:
+                second, i = _scan_int(pos_str, i + 1)
+                if second is not None and i < n and pos_str[i] in _SECOND_MARKS:
+                    return int(pos_str[start:deg]), minute, second
+        deg = pos_str.find('\u00b0', deg + 1)
+    return None
+
+
+def _scan_karaka(pos_str):
+    """Find the first "(...Karaka)" with no ')' inside; returns the text or None"""
+    end = pos_str.find('Karaka)')
+    while end != -1:
+        start = pos_str.find('(', pos_str.rfind(')', 0, end) + 1, end)
+        if start != -1 and start + 1 < end:
+            return pos_str[start + 1:end + 6]
+        end = pos_str.find('Karaka)', end + 7)
+    return None
 
 
 def parse_position(pos_str):
-    """Parse position string like '♑︎Capricorn 1° 3' 56\"' into structured data"""
+    """Parse position string like '♑︎Capricorn 1° 3’ 56\"' into structured data"""
     result = {'raw': pos_str}
     
-    # Extract sign
-    for sym, name in SIGN_SYMBOLS.items():
-        if sym in pos_str or name in pos_str:
-            result['sign'] = name
-            break
-    
-    # Extract degrees: pattern matches "X° Y' Z" or similar
-    deg_match = re.search(r'(\d+)\u00b0\s*(\d+)\D+(\d+)', pos_str)
-    if deg_match:
-        result['degree'] = int(deg_match.group(1))
-        result['minute'] = int(deg_match.group(2))
-        result['second'] = int(deg_match.group(3))
+    # Extract sign: leading glyph, else scan for a symbol or name
+    sign = _SIGN_BY_FIRST_CHAR.get(pos_str[:1])
+    if sign:
+        result['sign'] = sign
+    else:
+        sign_match = _SIGN_RE.search(pos_str)
+        if sign_match:
+            result['sign'] = _SIGN_LOOKUP[sign_match.group(0)]
+    
+    # Extract degrees: X° Y’ Z"
+    dms = _scan_dms(pos_str)
+    if dms:
+        result['degree'], result['minute'], result['second'] = dms
         result['totalDegree'] = round(result['degree'] + result['minute']/60 + result['second']/3600, 4)
     
     # Check retrograde
     result['isRetrograde'] = '℞' in pos_str
     
     # Extract Karaka
-    if 'Karaka' in pos_str:
-        karaka_match = re.search(r'\(([^)]+Karaka)\)', pos_str)
-        if karaka_match:
-            result['karaka'] = karaka_match.group(1)
+    karaka = _scan_karaka(pos_str)
+    if karaka:
+        result['karaka'] = karaka
     
     return result
 
 
+# 108 padas (27 nakshatras x 4) span the zodiac
+_PADA_SCALE = 108.0 / 360.0
+
+
+def get_nakshatra_pada(longitude):
+    """Calculate nakshatra and pada from absolute longitude"""
+    n = int(longitude * _PADA_SCALE)  # absolute pada index
+    return NAKSHATRA_NAMES[(n >> 2) % 27], (n & 3) + 1
+
+
+def _sign_dignity(planet_idx, sign_idx):
+    """Dignity of planet 0-6 (Sun..Saturn) in a sign"""
+    if sign_idx == EXALTED_SIGNS.get(planet_idx):
+        return 'Exalted'
+    if sign_idx == DEBILITATED_SIGNS.get(planet_idx):
+        return 'Debilitated'
+    if sign_idx in OWN_SIGNS.get(planet_idx, []):
+        return 'Own Sign'
+    if sign_idx == MOOLATRIKONA_SIGNS.get(planet_idx):
+        return 'Moolatrikona'
+    return 'Neutral'
+
+
+# Dignity lookup table indexed [planet][sign]
+_DIGNITY_BY_PLANET = tuple(
+    tuple(_sign_dignity(p, s) for s in range(12)) for p in range(7)
+)
+
+
+def angular_distance(long_a, long_b):
+    """Shortest arc in degrees between two absolute longitudes"""
+    diff = abs(long_a - long_b)
+    return 360 - diff if diff > 180 else diff
+
+
+def is_retrograde(speed_info, planet_idx):
+    """Check if planet is retrograde based on speed"""
+    if planet_idx in speed_info:
+        # Speed is in index 3 (daily motion), negative = retrograde
+        return speed_info[planet_idx][3] < 0
+    return False
+
+
+def _build_house_to_planet(chart_data):
+    """Ashtakavarga input: '/'-joined planet ids per sign, e.g. 'L/0/5'"""
+    house_planets = [[] for _ in range(12)]
+    for item in chart_data:
+        house_planets[item[1][0]].append('L' if item[0] == 'L' else str(item[0]))
+    return ['/'.join(p) for p in house_planets]
+
+
+@dataclass
+class PlanetPos:
+    """One planet in a formatted chart; orjson serializes it as a JSON object"""
+    __slots__ = ('planet', 'sign', 'signIndex', 'degree', 'nakshatra', 'pada', 'house', 'isRetrograde')
+    planet: str
+    sign: str
+    signIndex: int
+    degree: float
+    nakshatra: str
+    pada: int
+    house: int
+    isRetrograde: bool
+
+
+def format_chart(chart_data, speed_info, bhava_data=None, collect=None):
+    """Format chart data into readable structure with nakshatra, pada, house.
+    
+    If a ``collect`` dict is given, the same pass also gathers the Sun's
+    longitude and the sign dignity of Sun..Saturn into it, along with the
+    ashtakavarga ``house_to_planet`` list from _build_house_to_planet.
+    """
+    names = _PLANET_NAMES_9
+    signs = _SIGN_NAMES
+    result = []
+    
+    # Build house lookup from bhava data
+    house_lookup = {}
+    if bhava_data:
+        for item in bhava_data:
+            planets_in_house = item[2] if len(item) > 2 else []
+            house_num = item[0] + 1
+            for p in planets_in_house:
+                house_lookup[p] = house_num
+    
+    if collect is not None:
+        planet_dignities = []
+        sun_longitude = None
+    
+    for item in chart_data:
+        planet_id = item[0]
+        if planet_id == 'L':
+            name = 'Ascendant'
+            p_idx = -1
+        elif isinstance(planet_id, int) and planet_id < len(names):
+            name = names[planet_id]
+            p_idx = planet_id
+        else:
+            name = str(planet_id)
+            p_idx = -1
+        
+        pos_data = item[1]
+        if isinstance(pos_data, tuple) and len(pos_data) >= 2:
+            sign_idx = pos_data[0] if isinstance(pos_data[0], int) else 0
+            degree = pos_data[1] if len(pos_data) > 1 else pos_data[0]
+        elif isinstance(pos_data, list) and len(pos_data) >= 2:
+            sign_idx = pos_data[0]
+            degree = pos_data[1]
+        else:
+            sign_idx = 0
+            degree = 0
+        
+        # Calculate absolute longitude for nakshatra
+        abs_longitude = (sign_idx % 12) * 30 + degree
+        nakshatra, pada = get_nakshatra_pada(abs_longitude)
+        
+        # Get house position
+        house = house_lookup.get(planet_id, sign_idx + 1)  # Default to sign-based
+        
+        # Check retrograde (only for planets, not Lagna)
+        retro = is_retrograde(speed_info, p_idx) if p_idx >= 0 and p_idx <= 6 else False
+        
+        result.append(PlanetPos(
+            name,
+            signs[sign_idx % 12],
+            sign_idx % 12,
+            round(degree, 4) if isinstance(degree, float) else degree,
+            nakshatra,
+            pada,
+            house,
+            retro
+        ))
+        
+        if collect is not None:
+            # Dignity (Sun to Saturn only)
+            if 0 <= p_idx <= 6:
+                if p_idx == 0 and sun_longitude is None:
+                    sun_longitude = abs_longitude
+                dignity = _DIGNITY_BY_PLANET[p_idx][sign_idx % 12]
+                planet_dignities.append((p_idx, name, dignity, abs_longitude))
+    
+    if collect is not None:
+        collect['house_to_planet'] = _build_house_to_planet(chart_data)
+        collect['sun_longitude'] = sun_longitude
+        collect['dignities'] = planet_dignities
+    return result
+
+
+def format_bhava(bhava_data):
+    """Format Bhava Chalit data"""
+    result = []
+    for item in bhava_data:
+        house_num = item[0] + 1
+        degrees = item[1]
+        planets_in_house = item[2] if len(item) > 2 else []
+        
+        planet_list = []
+        for p in planets_in_house:
+            if p == 'L':
+                planet_list.append('Ascendant')
+            elif isinstance(p, int) and p < len(_PLANET_NAMES_9):
+                planet_list.append(_PLANET_NAMES_9[p])
+        
+        result.append({
+            'house': house_num,
+            'startDegree': round(degrees[0], 2),
+            'midDegree': round(degrees[1], 2),
+            'endDegree': round(degrees[2], 2),
+            'planets': planet_list
+        })
+    return result
+
+
+# Cached PyJHora computations.
+# Charts are pure functions of the birth data and ayanamsa, so repeat requests
+# for the same chart are served from these caches. Place is a namedtuple and
+# jd a float, so both can be used as cache keys directly.
+
+def _birth_key(data):
+    """Hashable key for the Horoscope cache"""
+    return (data.latitude, data.longitude, data.timezone,
+            data.year, data.month, data.day,
+            data.hour, data.minute, data.second,
+            data.ayanamsa.upper())
+
+
+def _jd_place(data):
+    """Set the ayanamsa mode and return (jd, place) for the birth data"""
+    drik.set_ayanamsa_mode(data.ayanamsa.upper())
+    place = drik.Place('Birth', data.latitude, data.longitude, data.timezone)
+    dob = (data.year, data.month, data.day)
+    tob = (data.hour, data.minute, data.second)
+    jd = utils.julian_day_number(dob, tob)
+    return jd, place
+
+
+@functools.lru_cache(maxsize=512)
+def _horoscope(latitude, longitude, timezone, year, month, day, hour, minute, second, ayanamsa):
+    return Horoscope(
+        latitude=latitude,
+        longitude=longitude,
+        timezone_offset=timezone,
+        date_in=Date(year, month, day),
+        birth_time=f'{hour:02d}:{minute:02d}:{second:02d}',
+        ayanamsa_mode=ayanamsa
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _horoscope_information(*key):
+    h = _horoscope(*key)
+    # SENTHIL and SUNDAR_SS derive their value from jd, so pass the chart's
+    drik.set_ayanamsa_mode(key[-1], None, h.julian_day)
+    return h.get_horoscope_information()
+
+
+@functools.lru_cache(maxsize=512)
+def _horoscope_chart_information(*key):
+    h = _horoscope(*key)
+    # SENTHIL and SUNDAR_SS derive their value from jd, so pass the chart's
+    drik.set_ayanamsa_mode(key[-1], None, h.julian_day)
+    return h.get_horoscope_information_for_chart()
+
+
+@functools.lru_cache(maxsize=512)
+def _speed_info(jd, place, ayanamsa):
+    drik.set_ayanamsa_mode(ayanamsa)
+    return drik.planets_speed_info(jd, place)
+
+
+@functools.lru_cache(maxsize=512)
+def _rasi(jd, place, ayanamsa):
+    drik.set_ayanamsa_mode(ayanamsa)
+    return charts.rasi_chart(jd, place)
+
+
+@functools.lru_cache(maxsize=512)
+def _bhava(jd, place, ayanamsa):
+    drik.set_ayanamsa_mode(ayanamsa)
+    return charts.bhava_chart(jd, place)
+
+
+@functools.lru_cache(maxsize=2048)
+def _divisional(jd, place, factor, ayanamsa):
+    # Varga charts are a pure mapping of the rasi positions, so derive them
+    # from the cached rasi chart instead of re-running the ephemeris per factor
+    return charts.divisional_positions_from_rasi_positions(
+        _rasi(jd, place, ayanamsa), divisional_chart_factor=factor)
+
+
+@functools.lru_cache(maxsize=512)
+def _shadbala(jd, place, ayanamsa):
+    drik.set_ayanamsa_mode(ayanamsa)
+    return strength.shad_bala(jd, place)
+
+
+@functools.lru_cache(maxsize=512)
+def _bhava_bala(jd, place, ayanamsa):
+    drik.set_ayanamsa_mode(ayanamsa)
+    return strength.bhava_bala(jd, place)
+
+
+class _ChartLabels:
+    """Stand-in for ``self`` in Horoscope's ``*_for_chart`` methods.
+    
+    Those methods compute from the (jd, place) they are given and only read
+    the language resource strings from the instance, so there is no need to
+    build a full Horoscope (calendar, charts, ...) just to call them.
+    """
+    
+    @property
+    def cal_key_list(self):
+        return utils.resource_strings
+
+
+_CHART_LABELS = _ChartLabels()
+
+
+@functools.lru_cache(maxsize=512)
+def _chara_karakas(jd, place, ayanamsa):
+    drik.set_ayanamsa_mode(ayanamsa)
+    return Horoscope.get_chara_karakas_for_chart(_CHART_LABELS, jd, place)
+
+
+@functools.lru_cache(maxsize=512)
+def _special_lagnas(jd, place, ayanamsa):
+    drik.set_ayanamsa_mode(ayanamsa)
+    return Horoscope.get_special_lagnas_for_chart(_CHART_LABELS, jd, place)
+
+
+@functools.lru_cache(maxsize=512)
+def _sphutas(jd, place, ayanamsa):
+    drik.set_ayanamsa_mode(ayanamsa)
+    return Horoscope.get_sphutas_for_chart(_CHART_LABELS, jd, place)
+
+
+@functools.lru_cache(maxsize=512)
+def _ashtakavarga_for(house_to_planet):
+    """Ashtakavarga for a house_to_planet tuple (independent of ayanamsa)"""
+    return ashtakavarga.get_ashtaka_varga(list(house_to_planet))
+
+
+# Response cache for the POST endpoints.
+# For a given server and PyJHora version every response is a deterministic
+# function of the birth data, so a hash of both versions plus the canonical
+# request body serves as a strong ETag: clients revalidating with
+# If-None-Match get a 304, and repeat requests are answered from an
+# in-process LRU of rendered bodies without touching PyJHora or orjson.
+# Bodies carry the user's birth details, so only the client may cache them
+# (private), and max-age is bounded so clients revalidate and pick up new
+# ETags after an upgrade.
+
+_RESPONSE_CACHE_SIZE = 512
+_response_cache = OrderedDict()
+_CACHE_CONTROL = 'private, max-age=86400'
+_ETAG_SALT = f'{API_VERSION}/pyjhora-{metadata.version("pyjhora")}'.encode()
+
+
+def birth_data_etag(data):
+    """Content hash of the server/PyJHora versions and canonicalized birth data"""
+    body = orjson.dumps(data.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(_ETAG_SALT + body, digest_size=16).hexdigest()
+
+
+def _etag_headers(etag):
+    return {'ETag': f'"{etag}"', 'Cache-Control': _CACHE_CONTROL}
+
+
+def _etag_lookup(request, data):
+    """Return (etag, response); response is a 304 or cached hit, else None"""
+    etag = birth_data_etag(data)
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match:
+        tags = {t.strip().removeprefix('W/') for t in if_none_match.split(',')}
+        if f'"{etag}"' in tags:
+            return etag, Response(status_code=304, headers=_etag_headers(etag))
+    
+    key = (request.url.path, etag)
+    body = _response_cache.get(key)
+    if body is None:
+        return etag, None
+    _response_cache.move_to_end(key)
+    return etag, _json_response(body, etag)
+
+
+def _json_response(body, etag):
+    return Response(body, media_type='application/json', headers=_etag_headers(etag))
+
+
+def _cache_payload(path, etag, payload):
+    """Render a computed payload into the response cache, evicting the oldest; returns the bytes"""
+    body = _response_cache[(path, etag)] = _dumps(payload)
+    if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+    return body
+
+
+def _etag_store(request, etag, payload):
+    """Cache a freshly computed payload and return it with ETag headers"""
+    return _json_response(_cache_payload(request.url.path, etag, payload), etag)
+
+
+# PyJHora keeps the ayanamsa mode (and swisseph's sidereal mode) in
+# process-wide state that its functions set and reset as they go, so two
+# calculations must never interleave. pyswisseph holds the GIL throughout,
+# so running them in parallel threads would gain nothing anyway.
+_pyjhora_lock = threading.Lock()
+
+
+def _locked(fn, *args):
+    with _pyjhora_lock:
+        return fn(*args)
+
+
+async def _run_pyjhora(fn, *args):
+    """Run a PyJHora calculation in a worker thread, one at a time"""
+    return await asyncio.to_thread(_locked, fn, *args)
+
+
 @app.get("/")
 async def root():
     return {
         "status": "ok",
         "message": "Vedic Kundali API powered by PyJHora",
-        "version": "1.0.0",
+        "version": API_VERSION,
         "endpoints": ["/api/kundali", "/api/planets", "/api/ashtakavarga", "/api/shadbala", "/api/dasha"]
     }
 
 
+def _kundali_payload(data):
+    """Compute the /api/kundali response body"""
+    birth_key = _birth_key(data)
+    h = _horoscope(*birth_key)
+    info = _horoscope_information(*birth_key)
+    chart_info = _horoscope_chart_information(*birth_key)
+    
+    # Parse planets
+    planets = []
+    for sym, name in PLANET_SYMBOLS.items():
+        key = f'Raasi-{sym}'
+        if key in info[0]:
+            pos = parse_position(info[0][key])
+            pos['name'] = name
+            planets.append(pos)
+    
+    # Parse houses from chart_info[1]
+    houses = []
+    house_list = chart_info[1]
+    for i, planet_str in enumerate(house_list):
+        houses.append({
+            'house': i + 1,
+            'planets': [p.strip().replace('℞', '').replace('\n', '') for p in planet_str.split('\n') if p.strip()]
+        })
+    
+    return {
+        "status": "success",
+        "data": {
+            "name": data.name,
+            "birthData": {
+                "date": f"{data.year}-{data.month:02d}-{data.day:02d}",
+                "time": f"{data.hour:02d}:{data.minute:02d}:{data.second:02d}",
+                "latitude": data.latitude,
+                "longitude": data.longitude,
+                "timezone": data.timezone,
+                "ayanamsa": data.ayanamsa
+            },
+            "planets": planets,
+            "houses": houses,
+            "calendar": h.calendar_info,
+            "ascendant": chart_info[2] if len(chart_info) > 2 else None
+        }
+    }
+
+
 @app.post("/api/kundali")
-async def get_complete_kundali(data: BirthData):
+async def get_complete_kundali(data: BirthData, request: Request):
     """Get complete Kundali data"""
+    etag, cached = _etag_lookup(request, data)
+    if cached is not None:
+        return cached
+    
     try:
-        h = Horoscope(
-            latitude=data.latitude,
-            longitude=data.longitude,
-            timezone_offset=data.timezone,
-            date_in=Date(data.year, data.month, data.day),
-            birth_time=f'{data.hour:02d}:{data.minute:02d}:{data.second:02d}',
-            ayanamsa_mode=data.ayanamsa.upper()
-        )
-        
-        info = h.get_horoscope_information()
-        chart_info = h.get_horoscope_information_for_chart()
-        
-        # Parse planets
-        planets = []
-        for sym, name in PLANET_SYMBOLS.items():
-            key = f'Raasi-{sym}'
-            if key in info[0]:
-                pos = parse_position(info[0][key])
-                pos['name'] = name
-                planets.append(pos)
-        
-        # Parse houses from chart_info[1]
-        houses = []
-        house_list = chart_info[1]
-        for i, planet_str in enumerate(house_list):
-            houses.append({
-                'house': i + 1,
-                'planets': [p.strip().replace('℞', '').replace('\n', '') for p in planet_str.split('\n') if p.strip()]
-            })
-        
-        return {
-            "status": "success",
-            "data": {
-                "name": data.name,
-                "birthData": {
-                    "date": f"{data.year}-{data.month:02d}-{data.day:02d}",
-                    "time": f"{data.hour:02d}:{data.minute:02d}:{data.second:02d}",
-                    "latitude": data.latitude,
-                    "longitude": data.longitude,
-                    "timezone": data.timezone,
-                    "ayanamsa": data.ayanamsa
-                },
-                "planets": planets,
-                "houses": houses,
-                "calendar": h.calendar_info,
-                "ascendant": chart_info[2] if len(chart_info) > 2 else None
-            }
-        }
+        return _etag_store(request, etag, await _run_pyjhora(_kundali_payload, data))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}\n{traceback.format_exc()}")
+        log.exception("kundali calculation failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _planets_payload(data):
+    """Compute the /api/planets response body"""
+    info = _horoscope_information(*_birth_key(data))
+    planets = []
+    
+    for sym, name in PLANET_SYMBOLS.items():
+        key = f'Raasi-{sym}'
+        if key in info[0]:
+            pos = parse_position(info[0][key])
+            pos['name'] = name
+            planets.append(pos)
+    
+    return {"status": "success", "planets": planets}
 
 
 @app.post("/api/planets")
-async def get_planets(data: BirthData):
+async def get_planets(data: BirthData, request: Request):
     """Get planetary positions"""
+    etag, cached = _etag_lookup(request, data)
+    if cached is not None:
+        return cached
+    
     try:
-        h = Horoscope(
-            latitude=data.latitude,
-            longitude=data.longitude,
-            timezone_offset=data.timezone,
-            date_in=Date(data.year, data.month, data.day),
-            birth_time=f'{data.hour:02d}:{data.minute:02d}:{data.second:02d}',
-            ayanamsa_mode=data.ayanamsa.upper()
-        )
-        
-        info = h.get_horoscope_information()
-        planets = []
-        
-        for sym, name in PLANET_SYMBOLS.items():
-            key = f'Raasi-{sym}'
-            if key in info[0]:
-                pos = parse_position(info[0][key])
-                pos['name'] = name
-                planets.append(pos)
-        
-        return {"status": "success", "planets": planets}
+        return _etag_store(request, etag, await _run_pyjhora(_planets_payload, data))
     except Exception as e:
+        log.exception("planets calculation failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _ashtakavarga_payload(data):
+    """Compute the /api/ashtakavarga response body"""
+    jd, place = _jd_place(data)
+    ayanamsa = data.ayanamsa.upper()
+    
+    # Get rasi chart
+    rasi = _rasi(jd, place, ayanamsa)
+    
+    # Convert to house_to_planet format expected by ashtakavarga
+    house_to_planet = _build_house_to_planet(rasi)
+    
+    # Calculate Ashtakavarga
+    bav, sav, pav = _ashtakavarga_for(tuple(house_to_planet))
+    
+    bhinnashtakavarga = {}
+    for i, name in enumerate(_PLANET_NAMES_8):
+        if i < len(bav):
+            bhinnashtakavarga[name] = {
+                "points": bav[i],
+                "total": sum(bav[i]),
+                "bySign": dict(zip(_SIGN_NAMES, bav[i]))
+            }
+    
+    sarvashtakavarga = {
+        "points": sav,
+        "total": sum(sav),
+        "bySign": dict(zip(_SIGN_NAMES, sav))
+    }
+    
+    return {
+        "status": "success",
+        "ashtakavarga": {
+            "bhinnashtakavarga": bhinnashtakavarga,
+            "sarvashtakavarga": sarvashtakavarga
+        }
+    }
+
+
 @app.post("/api/ashtakavarga")
-async def get_ashtakavarga_data(data: BirthData):
+async def get_ashtakavarga_data(data: BirthData, request: Request):
     """Get Ashtakavarga (Bhinnashtakavarga and Sarvashtakavarga)"""
+    etag, cached = _etag_lookup(request, data)
+    if cached is not None:
+        return cached
+    
     try:
-        drik.set_ayanamsa_mode(data.ayanamsa.upper())
-        place = drik.Place('Birth', data.latitude, data.longitude, data.timezone)
-        dob = (data.year, data.month, data.day)
-        tob = (data.hour, data.minute, data.second)
-        jd = utils.julian_day_number(dob, tob)
-        
-        # Get rasi chart
-        rasi = charts.rasi_chart(jd, place)
-        
-        # Convert to house_to_planet format expected by ashtakavarga
-        house_to_planet = ['' for _ in range(12)]
-        for item in rasi:
-            planet_id = item[0]
-            house = item[1][0]
-            planet_str = 'L' if planet_id == 'L' else str(planet_id)
-            
-            if house_to_planet[house]:
-                house_to_planet[house] += '/' + planet_str
-            else:
-                house_to_planet[house] = planet_str
-        
-        # Calculate Ashtakavarga
-        bav, sav, pav = ashtakavarga.get_ashtaka_varga(house_to_planet)
-        
-        # Format results
-        planet_names = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Ascendant']
-        sign_names = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                      'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
-        
-        bhinnashtakavarga = {}
-        for i, name in enumerate(planet_names):
-            if i < len(bav):
-                bhinnashtakavarga[name] = {
-                    "points": bav[i],
-                    "total": sum(bav[i]),
-                    "bySign": {sign_names[j]: bav[i][j] for j in range(12)}
-                }
-        
-        sarvashtakavarga = {
-            "points": sav,
-            "total": sum(sav),
-            "bySign": {sign_names[i]: sav[i] for i in range(12)}
-        }
-        
-        return {
-            "status": "success",
-            "ashtakavarga": {
-                "bhinnashtakavarga": bhinnashtakavarga,
-                "sarvashtakavarga": sarvashtakavarga
-            }
-        }
+        return _etag_store(request, etag, await _run_pyjhora(_ashtakavarga_payload, data))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}\n{traceback.format_exc()}")
+        log.exception("ashtakavarga calculation failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _shadbala_payload(data):
+    """Compute the /api/shadbala response body"""
+    jd, place = _jd_place(data)
+    ayanamsa = data.ayanamsa.upper()
+    
+    sb = _shadbala(jd, place, ayanamsa)
+    
+    result = {}
+    if sb:
+        for i, name in enumerate(_PLANET_NAMES_7):
+            if i < len(sb):
+                result[name] = {
+                    'total': round(sb[i], 2) if isinstance(sb[i], (int, float)) else sb[i]
+                }
+    
+    return {"status": "success", "shadbala": result}
 
 
 @app.post("/api/shadbala")
-async def get_shadbala(data: BirthData):
+async def get_shadbala(data: BirthData, request: Request):
     """Get Shadbala (planetary strength)"""
+    etag, cached = _etag_lookup(request, data)
+    if cached is not None:
+        return cached
+    
     try:
-        drik.set_ayanamsa_mode(data.ayanamsa.upper())
-        place = drik.Place('Birth', data.latitude, data.longitude, data.timezone)
-        dob = (data.year, data.month, data.day)
-        tob = (data.hour, data.minute, data.second)
-        jd = utils.julian_day_number(dob, tob)
-        
-        sb = strength.shad_bala(jd, place)
-        
-        planet_names = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
-        result = {}
-        
-        if sb:
-            for i, name in enumerate(planet_names):
-                if i < len(sb):
-                    result[name] = {
-                        'total': round(sb[i], 2) if isinstance(sb[i], (int, float)) else sb[i]
-                    }
-        
-        return {"status": "success", "shadbala": result}
+        return _etag_store(request, etag, await _run_pyjhora(_shadbala_payload, data))
     except Exception as e:
+        log.exception("shadbala calculation failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _dasha_payload(data):
+    """Compute the /api/dasha response body"""
+    h = _horoscope(*_birth_key(data))
+    
+    # Extract dasha info from calendar_info
+    cal = h.calendar_info
+    dasha_info = {k: v for k, v in cal.items() if 'dasha' in k.lower() or 'dhasa' in k.lower()}
+    
+    return {"status": "success", "dasha": dasha_info, "calendar": cal}
+
+
 @app.post("/api/dasha")
-async def get_dasha(data: BirthData):
+async def get_dasha(data: BirthData, request: Request):
     """Get Vimshottari Dasha periods"""
+    etag, cached = _etag_lookup(request, data)
+    if cached is not None:
+        return cached
+    
     try:
-        h = Horoscope(
-            latitude=data.latitude,
-            longitude=data.longitude,
-            timezone_offset=data.timezone,
-            date_in=Date(data.year, data.month, data.day),
-            birth_time=f'{data.hour:02d}:{data.minute:02d}:{data.second:02d}',
-            ayanamsa_mode=data.ayanamsa.upper()
-        )
-        
-        # Extract dasha info from calendar_info
-        cal = h.calendar_info
-        dasha_info = {k: v for k, v in cal.items() if 'dasha' in k.lower() or 'dhasa' in k.lower()}
-        
-        return {"status": "success", "dasha": dasha_info, "calendar": cal}
+        return _etag_store(request, etag, await _run_pyjhora(_dasha_payload, data))
     except Exception as e:
+        log.exception("dasha calculation failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/complete")
-async def get_complete_data(data: BirthData):
-    """Get ALL charts and data at once - comprehensive endpoint"""
-    try:
-        drik.set_ayanamsa_mode(data.ayanamsa.upper())
-        place = drik.Place('Birth', data.latitude, data.longitude, data.timezone)
-        dob = (data.year, data.month, data.day)
-        tob = (data.hour, data.minute, data.second)
-        jd = utils.julian_day_number(dob, tob)
-        
-        planet_names = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
-        sign_names = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                      'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
-        
-        # Get speed info for retrograde detection
-        speed_info = drik.planets_speed_info(jd, place)
-        
-        def get_nakshatra_pada(longitude):
-            """Calculate nakshatra and pada from absolute longitude"""
-            nak_span = 360 / 27  # 13.333...degrees per nakshatra
-            pada_span = nak_span / 4
-            nak_index = int(longitude / nak_span) % 27
-            pada = int((longitude % nak_span) / pada_span) + 1
-            return NAKSHATRA_NAMES[nak_index], pada
-        
-        def is_retrograde(planet_idx):
-            """Check if planet is retrograde based on speed"""
-            if planet_idx in speed_info:
-                # Speed is in index 3 (daily motion), negative = retrograde
-                return speed_info[planet_idx][3] < 0
-            return False
-        
-        def format_chart(chart_data, bhava_data=None):
-            """Format chart data into readable structure with nakshatra, pada, house"""
-            result = []
-            
-            # Build house lookup from bhava data
-            house_lookup = {}
-            if bhava_data:
-                for item in bhava_data:
-                    planets_in_house = item[2] if len(item) > 2 else []
-                    house_num = item[0] + 1
-                    for p in planets_in_house:
-                        house_lookup[p] = house_num
-            
-            for item in chart_data:
-                planet_id = item[0]
-                if planet_id == 'L':
-                    name = 'Ascendant'
-                    p_idx = -1
-                elif isinstance(planet_id, int) and planet_id < len(planet_names):
-                    name = planet_names[planet_id]
-                    p_idx = planet_id
-                else:
-                    name = str(planet_id)
-                    p_idx = -1
-                
-                pos_data = item[1]
-                if isinstance(pos_data, tuple) and len(pos_data) >= 2:
-                    sign_idx = pos_data[0] if isinstance(pos_data[0], int) else 0
-                    degree = pos_data[1] if len(pos_data) > 1 else pos_data[0]
-                elif isinstance(pos_data, list) and len(pos_data) >= 2:
-                    sign_idx = pos_data[0]
-                    degree = pos_data[1]
-                else:
-                    sign_idx = 0
-                    degree = 0
-                
-                # Calculate absolute longitude for nakshatra
-                abs_longitude = (sign_idx % 12) * 30 + degree
-                nakshatra, pada = get_nakshatra_pada(abs_longitude)
-                
-                # Get house position
-                house = house_lookup.get(planet_id, sign_idx + 1)  # Default to sign-based
-                
-                # Check retrograde (only for planets, not Lagna)
-                retro = is_retrograde(p_idx) if p_idx >= 0 and p_idx <= 6 else False
-                
-                result.append({
-                    'planet': name,
-                    'sign': sign_names[sign_idx % 12],
-                    'signIndex': sign_idx % 12,
-                    'degree': round(degree, 4) if isinstance(degree, float) else degree,
-                    'nakshatra': nakshatra,
-                    'pada': pada,
-                    'house': house,
-                    'isRetrograde': retro
-                })
-            return result
-        
-        def format_bhava(bhava_data):
-            """Format Bhava Chalit data"""
-            result = []
-            for item in bhava_data:
-                house_num = item[0] + 1
-                degrees = item[1]
-                planets_in_house = item[2] if len(item) > 2 else []
-                
-                planet_list = []
-                for p in planets_in_house:
-                    if p == 'L':
-                        planet_list.append('Ascendant')
-                    elif isinstance(p, int) and p < len(planet_names):
-                        planet_list.append(planet_names[p])
-                
-                result.append({
-                    'house': house_num,
-                    'startDegree': round(degrees[0], 2),
-                    'midDegree': round(degrees[1], 2),
-                    'endDegree': round(degrees[2], 2),
-                    'planets': planet_list
-                })
-            return result
-        
-        # Get all charts
-        rasi = charts.rasi_chart(jd, place)
-        bhava = charts.bhava_chart(jd, place)
-        
-        # Divisional charts
-        d3 = charts.divisional_chart(jd, place, divisional_chart_factor=3)   # Drekkana
-        d9 = charts.divisional_chart(jd, place, divisional_chart_factor=9)   # Navamsa
-        d12 = charts.divisional_chart(jd, place, divisional_chart_factor=12) # Dwadashamsha
-        d45 = charts.divisional_chart(jd, place, divisional_chart_factor=45) # Akshavedamsha
-        d60 = charts.divisional_chart(jd, place, divisional_chart_factor=60) # Shashtiamsha
-        
-        # Ashtakavarga
-        house_to_planet = ['' for _ in range(12)]
-        for item in rasi:
-            planet_id = item[0]
-            house = item[1][0]
-            planet_str = 'L' if planet_id == 'L' else str(planet_id)
-            if house_to_planet[house]:
-                house_to_planet[house] += '/' + planet_str
-            else:
-                house_to_planet[house] = planet_str
-        
-        bav, sav, _ = ashtakavarga.get_ashtaka_varga(house_to_planet)
-        
-        ashtakavarga_result = {
-            'bhinnashtakavarga': {},
-            'sarvashtakavarga': {'points': sav, 'total': sum(sav)}
-        }
-        for i, name in enumerate(['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']):
-            if i < len(bav):
-                ashtakavarga_result['bhinnashtakavarga'][name] = {
-                    'points': bav[i],
-                    'total': sum(bav[i])
-                }
-        
-        # Shadbala
-        sb = strength.shad_bala(jd, place)
-        shadbala_result = {}
-        if sb:
-            for i, name in enumerate(['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']):
-                if i < len(sb):
-                    shadbala_result[name] = {
-                        'total': round(sb[i], 2) if isinstance(sb[i], (int, float)) else sb[i]
-                    }
-        
-        # NEW: Bhava Bala (House Strength)
-        bhava_bala_raw = strength.bhava_bala(jd, place)
-        bhava_bala_result = {}
-        if bhava_bala_raw and len(bhava_bala_raw) >= 1:
-            for i in range(12):
-                bhava_bala_result[f'House {i+1}'] = {
-                    'strength': round(bhava_bala_raw[0][i], 2) if i < len(bhava_bala_raw[0]) else 0,
-                    'ratio': round(bhava_bala_raw[2][i], 2) if len(bhava_bala_raw) > 2 and i < len(bhava_bala_raw[2]) else 0
-                }
-        
-        # NEW: Planetary Dignity & Combustion
-        sun_longitude = None
-        for item in rasi:
-            if item[0] == 0:  # Sun
-                sun_longitude = item[1][0] * 30 + item[1][1]
-                break
-        
-        dignity_result = {}
-        for item in rasi:
-            p_id = item[0]
-            if isinstance(p_id, int) and p_id < 7:
-                sign_idx = item[1][0]
-                planet_long = sign_idx * 30 + item[1][1]
-                
-                # Dignity
-                dignity = 'Neutral'
-                if sign_idx == EXALTED_SIGNS.get(p_id):
-                    dignity = 'Exalted'
-                elif sign_idx == DEBILITATED_SIGNS.get(p_id):
-                    dignity = 'Debilitated'
-                elif sign_idx in OWN_SIGNS.get(p_id, []):
-                    dignity = 'Own Sign'
-                elif sign_idx == MOOLATRIKONA_SIGNS.get(p_id):
-                    dignity = 'Moolatrikona'
-                
-                # Combustion (only for Moon-Saturn, not Sun itself)
-                is_combust = False
-                sun_distance = None
-                if p_id >= 1 and p_id <= 6 and sun_longitude is not None:
-                    diff = abs(planet_long - sun_longitude)
-                    if diff > 180:
-                        diff = 360 - diff
-                    sun_distance = round(diff, 2)
-                    is_combust = diff < COMBUSTION_DEGREES.get(p_id, 15)
-                
-                planet_name = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn'][p_id]
-                dignity_result[planet_name] = {
-                    'dignity': dignity,
-                    'isCombust': is_combust,
-                    'sunDistance': sun_distance
+def _complete_payload(data):
+    """Compute the /api/complete response body"""
+    jd, place = _jd_place(data)
+    ayanamsa = data.ayanamsa.upper()
+    
+    # Called via _run_pyjhora, so these run one after another under the lock
+    speed_info = _speed_info(jd, place, ayanamsa)  # Speed info for retrograde detection
+    rasi = _rasi(jd, place, ayanamsa)
+    bhava = _bhava(jd, place, ayanamsa)
+    sb = _shadbala(jd, place, ayanamsa)
+    bhava_bala_raw = _bhava_bala(jd, place, ayanamsa)
+    chara_karakas_raw = _chara_karakas(jd, place, ayanamsa)
+    special_lagnas_raw = _special_lagnas(jd, place, ayanamsa)
+    sphutas_raw = _sphutas(jd, place, ayanamsa)
+    
+    # Divisional charts: D3 Drekkana, D9 Navamsa, D12 Dwadashamsha,
+    # D45 Akshavedamsha, D60 Shashtiamsha - all mapped from the rasi above
+    d3, d9, d12, d45, d60 = (_divisional(jd, place, factor, ayanamsa)
+                             for factor in (3, 9, 12, 45, 60))
+    
+    # Rasi chart, plus ashtakavarga/dignity inputs in the same pass
+    rasi_info = {}
+    rasi_formatted = format_chart(rasi, speed_info, bhava, collect=rasi_info)
+    
+    # Ashtakavarga
+    bav, sav, _ = _ashtakavarga_for(tuple(rasi_info['house_to_planet']))
+    
+    ashtakavarga_result = {
+        'bhinnashtakavarga': {},
+        'sarvashtakavarga': {'points': sav, 'total': sum(sav)}
+    }
+    for i, name in enumerate(_PLANET_NAMES_7):
+        if i < len(bav):
+            ashtakavarga_result['bhinnashtakavarga'][name] = {
+                'points': bav[i],
+                'total': sum(bav[i])
+            }
+    
+    # Shadbala
+    shadbala_result = {}
+    if sb:
+        for i, name in enumerate(_PLANET_NAMES_7):
+            if i < len(sb):
+                shadbala_result[name] = {
+                    'total': round(sb[i], 2) if isinstance(sb[i], (int, float)) else sb[i]
                 }
-        
-        # NEW: Chara Karakas (from Horoscope class)
-        h = Horoscope(
-            latitude=data.latitude,
-            longitude=data.longitude,
-            timezone_offset=data.timezone,
-            date_in=Date(data.year, data.month, data.day),
-            birth_time=f'{data.hour:02d}:{data.minute:02d}:{data.second:02d}',
-            ayanamsa_mode=data.ayanamsa.upper()
-        )
-        
-        chara_karakas_raw = h.get_chara_karakas_for_chart(jd, place)
-        chara_karakas = {}
-        if chara_karakas_raw and 'Karakas' in chara_karakas_raw:
-            for i, karakas_str in enumerate(chara_karakas_raw['Karakas']):
-                if karakas_str.strip():
-                    house_karakas = [k.strip() for k in karakas_str.strip().split('\n') if k.strip()]
-                    for k in house_karakas:
-                        full_name = KARAKA_NAMES.get(k, k)
-                        chara_karakas[full_name] = {'house': i + 1, 'abbreviation': k}
-        
-        # NEW: Special Lagnas
-        special_lagnas_raw = h.get_special_lagnas_for_chart(jd, place)
-        special_lagnas = {}
-        if special_lagnas_raw and 'Special Lagnas' in special_lagnas_raw:
-            for i, lagnas_str in enumerate(special_lagnas_raw['Special Lagnas']):
-                if lagnas_str.strip():
-                    house_lagnas = [l.strip() for l in lagnas_str.strip().split('\n') if l.strip()]
-                    for l in house_lagnas:
-                        full_name = SPECIAL_LAGNA_NAMES.get(l, l)
-                        special_lagnas[full_name] = {'house': i + 1, 'abbreviation': l}
-        
-        # NEW: Sphutas
-        sphutas_raw = h.get_sphutas_for_chart(jd, place)
-        sphutas = {}
-        if sphutas_raw and 'Sphuta' in sphutas_raw:
-            for i, sphuta_str in enumerate(sphutas_raw['Sphuta']):
-                if sphuta_str.strip():
-                    house_sphutas = [s.strip() for s in sphuta_str.strip().split('\n') if s.strip()]
-                    for s in house_sphutas:
-                        sphutas[s] = {'house': i + 1}
-        
-        return {
-            "status": "success",
-            "data": {
-                "birthData": {
-                    "name": data.name,
-                    "date": f"{data.year}-{data.month:02d}-{data.day:02d}",
-                    "time": f"{data.hour:02d}:{data.minute:02d}:{data.second:02d}",
-                    "latitude": data.latitude,
-                    "longitude": data.longitude,
-                    "timezone": data.timezone,
-                    "ayanamsa": data.ayanamsa
-                },
-                "charts": {
-                    "rasi": format_chart(rasi, bhava),
-                    "bhavaChalit": format_bhava(bhava),
-                    "d3_drekkana": format_chart(d3) if d3 else None,
-                    "d9_navamsa": format_chart(d9) if d9 else None,
-                    "d12_dwadashamsha": format_chart(d12) if d12 else None,
-                    "d45_akshavedamsha": format_chart(d45) if d45 else None,
-                    "d60_shashtiamsha": format_chart(d60) if d60 else None
-                },
-                "ashtakavarga": ashtakavarga_result,
-                "shadbala": shadbala_result,
-                "bhavaBala": bhava_bala_result,
-                "dignity": dignity_result,
-                "charaKarakas": chara_karakas,
-                "specialLagnas": special_lagnas,
-                "sphutas": sphutas
+    
+    # NEW: Bhava Bala (House Strength)
+    bhava_bala_result = {}
+    if bhava_bala_raw and len(bhava_bala_raw) >= 1:
+        for i in range(12):
+            bhava_bala_result[f'House {i+1}'] = {
+                'strength': round(bhava_bala_raw[0][i], 2) if i < len(bhava_bala_raw[0]) else 0,
+                'ratio': round(bhava_bala_raw[2][i], 2) if len(bhava_bala_raw) > 2 and i < len(bhava_bala_raw[2]) else 0
             }
+    
+    # NEW: Planetary Dignity & Combustion
+    sun_longitude = rasi_info['sun_longitude']
+    dignity_result = {}
+    for p_id, planet_name, dignity, planet_long in rasi_info['dignities']:
+        # Combustion (only for Moon-Saturn, not Sun itself)
+        is_combust = False
+        sun_distance = None
+        if p_id >= 1 and sun_longitude is not None:
+            diff = angular_distance(planet_long, sun_longitude)
+            sun_distance = round(diff, 2)
+            is_combust = diff < COMBUSTION_DEGREES.get(p_id, 15)
+        
+        dignity_result[planet_name] = {
+            'dignity': dignity,
+            'isCombust': is_combust,
+            'sunDistance': sun_distance
+        }
+    
+    # NEW: Chara Karakas
+    chara_karakas = {}
+    if chara_karakas_raw and 'Karakas' in chara_karakas_raw:
+        for i, karakas_str in enumerate(chara_karakas_raw['Karakas']):
+            if karakas_str.strip():
+                house_karakas = [k.strip() for k in karakas_str.strip().split('\n') if k.strip()]
+                for k in house_karakas:
+                    full_name = KARAKA_NAMES.get(k, k)
+                    chara_karakas[full_name] = {'house': i + 1, 'abbreviation': k}
+    
+    # NEW: Special Lagnas
+    special_lagnas = {}
+    if special_lagnas_raw and 'Special Lagnas' in special_lagnas_raw:
+        for i, lagnas_str in enumerate(special_lagnas_raw['Special Lagnas']):
+            if lagnas_str.strip():
+                house_lagnas = [l.strip() for l in lagnas_str.strip().split('\n') if l.strip()]
+                for l in house_lagnas:
+                    full_name = SPECIAL_LAGNA_NAMES.get(l, l)
+                    special_lagnas[full_name] = {'house': i + 1, 'abbreviation': l}
+    
+    # NEW: Sphutas
+    sphutas = {}
+    if sphutas_raw and 'Sphuta' in sphutas_raw:
+        for i, sphuta_str in enumerate(sphutas_raw['Sphuta']):
+            if sphuta_str.strip():
+                house_sphutas = [s.strip() for s in sphuta_str.strip().split('\n') if s.strip()]
+                for s in house_sphutas:
+                    sphutas[s] = {'house': i + 1}
+    
+    return {
+        "status": "success",
+        "data": {
+            "birthData": {
+                "name": data.name,
+                "date": f"{data.year}-{data.month:02d}-{data.day:02d}",
+                "time": f"{data.hour:02d}:{data.minute:02d}:{data.second:02d}",
+                "latitude": data.latitude,
+                "longitude": data.longitude,
+                "timezone": data.timezone,
+                "ayanamsa": data.ayanamsa
+            },
+            "charts": {
+                "rasi": rasi_formatted,
+                "bhavaChalit": format_bhava(bhava),
+                "d3_drekkana": format_chart(d3, speed_info) if d3 else None,
+                "d9_navamsa": format_chart(d9, speed_info) if d9 else None,
+                "d12_dwadashamsha": format_chart(d12, speed_info) if d12 else None,
+                "d45_akshavedamsha": format_chart(d45, speed_info) if d45 else None,
+                "d60_shashtiamsha": format_chart(d60, speed_info) if d60 else None
+            },
+            "ashtakavarga": ashtakavarga_result,
+            "shadbala": shadbala_result,
+            "bhavaBala": bhava_bala_result,
+            "dignity": dignity_result,
+            "charaKarakas": chara_karakas,
+            "specialLagnas": special_lagnas,
+            "sphutas": sphutas
         }
+    }
+
+
+@app.post("/api/complete")
+async def get_complete_data(data: BirthData, request: Request):
+    """Get ALL charts and data at once - comprehensive endpoint"""
+    etag, cached = _etag_lookup(request, data)
+    if cached is not None:
+        return cached
+    
+    try:
+        return _etag_store(request, etag, await _run_pyjhora(_complete_payload, data))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}\n{traceback.format_exc()}")
+        log.exception("complete chart calculation failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Charts computed at startup so the first requests for them are cache hits
+PREWARM_BIRTH_DATA = (
+    BirthData(name="Test", year=2004, month=1, day=21, hour=13, minute=10, second=0,
+              latitude=23.2585, longitude=77.4020, timezone=5.5, ayanamsa="LAHIRI"),
+)
+
+
+async def _prewarm():
+    """Fill the helper and response caches for PREWARM_BIRTH_DATA"""
+    for data in PREWARM_BIRTH_DATA:
+        try:
+            payload = await _run_pyjhora(_complete_payload, data)
+            _cache_payload('/api/complete', birth_data_etag(data), payload)
+        except Exception:
+            log.exception("prewarm failed for %s", data.name)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+"""
+Regression checks for api_server helpers against real PyJHora output
+"""
+
+from jhora import utils
+from jhora.panchanga import drik
+
+import api_server
+from api_server import _scan_dms, parse_position
+
+
+def test_parse_position_reads_pyjhora_dms():
+    # Build the string from PyJHora itself, so its minute symbol (’) and
+    # karaka label are the ones actually emitted
+    karaka = utils.resource_strings['atma_karaka_str']
+    pos_str = '♑︎Capricorn ' + utils.to_dms(1.0656, is_lat_long='plong') + f' ({karaka})'
+    pos = parse_position(pos_str)
+    assert pos['sign'] == 'Capricorn'
+    assert (pos['degree'], pos['minute'], pos['second']) == (1, 3, 56)
+    assert pos['totalDegree'] == 1.0656
+    assert pos['karaka'] == karaka
+
+
+def test_scan_dms_matches_pyjhora_to_dms():
+    # as_string=False wraps degrees past 23 (it's also used for times), so
+    # sweep [0, 24) where the tuple and the 'plong' string agree
+    for i in range(2400):
+        deg = i / 100 + 0.0037
+        expected = tuple(utils.to_dms(deg, as_string=False))
+        assert _scan_dms(utils.to_dms(deg, is_lat_long='plong')) == expected
+
+
+def test_horoscope_information_accepts_jd_dependent_ayanamsa(monkeypatch):
+    # SENTHIL and SUNDAR_SS compute the ayanamsa from jd; setting either mode
+    # without one raises before the Horoscope methods run
+    class FakeHoroscope:
+        julian_day = utils.julian_day_number((2004, 1, 21), (13, 10, 0))
+
+        def get_horoscope_information(self):
+            return 'info'
+
+        def get_horoscope_information_for_chart(self):
+            return 'chart'
+
+    monkeypatch.setattr(api_server, '_horoscope', lambda *key: FakeHoroscope())
+    try:
+        for mode in ('SENTHIL', 'SUNDAR_SS'):
+            key = (23.2585, 77.4020, 5.5, 2004, 1, 21, 13, 10, 0, mode)
+            assert api_server._horoscope_information.__wrapped__(*key) == 'info'
+            assert api_server._horoscope_chart_information.__wrapped__(*key) == 'chart'
+    finally:
+        drik.set_ayanamsa_mode('LAHIRI')